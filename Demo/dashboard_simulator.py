@@ -7,132 +7,295 @@ Simulates a live dashboard showing carbon metrics during test execution
 import time
 import json
 import os
+import sys
+import uuid
 from datetime import datetime, timedelta
 import random
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Test scenarios the simulated frameworks pick from
+_TEST_SCENARIOS: tuple[str, ...] = (
+    "User Login Test",
+    "Product Search Test",
+    "Cart Functionality Test",
+    "Checkout Process Test",
+    "Payment Integration Test",
+    "Order Confirmation Test",
+)
+
+# Indices into the per-framework running-total arrays
+ENERGY, CARBON, TESTS = 0, 1, 2
+
+@njit(cache=True, fastmath=True)
+def _compute_metrics(cpu_watts, cpu_util, mem_wpg, mem_gb, duration, net_overhead, grid_intensity):
+    """Numeric core of a simulated test run: returns (energy_joules, carbon_g, energy_wh)"""
+    cpu_energy = (cpu_watts * cpu_util * duration) / 3600  # Wh
+    memory_energy = (mem_wpg * mem_gb * duration) / 3600  # Wh
+    total_energy_wh = cpu_energy + memory_energy + net_overhead
+    return total_energy_wh * 3600, (total_energy_wh * grid_intensity) / 1000, total_energy_wh
+
 class CarbonDashboardSimulator:
+    # Resource usage ranges sampled per simulated test
+    SUSTAINABLE_CPU_RANGE = (0.15, 0.25)  # 15-25% CPU
+    SUSTAINABLE_MEMORY_RANGE = (0.5, 1.0)  # 0.5-1GB RAM
+    WASTEFUL_CPU_RANGE = (0.6, 0.8)  # 60-80% CPU
+    WASTEFUL_MEMORY_RANGE = (2.0, 3.5)  # 2-3.5GB RAM
+    WASTEFUL_NETWORK_RANGE = (0.1, 0.2)  # Wh of network overhead
+    SUSTAINABLE_NETWORK_EFFICIENCY = 0.8  # 80% efficient requests
+    WASTEFUL_NETWORK_EFFICIENCY = 0.3  # 30% efficient requests
+    TEST_DURATION_RANGE = (3, 8)  # 3-8 second tests
+    TEST_INTERVAL_RANGE = (2, 4)  # seconds between tests
+    
+    # Dashboard frame templates, filled with a single %-format per redraw
+    _TEMPLATE = (
+        "\n" + "=" * 80 + "\n"
+        "🌱 NETZERO TESTOPS - REAL-TIME CARBON DASHBOARD 🌱\n"
+        + "=" * 80 + "\n"
+        "📊 Test Execution Summary (Updated: %s)\n"
+        + "-" * 80 + "\n"
+        "🟢 Sustainable Framework:\n"
+        "   Energy Consumed: %.2f J\n"
+        "   Carbon Footprint: %.6f g CO₂e\n"
+        "   Tests Executed: %d\n"
+        "\n🔴 Wasteful Framework:\n"
+        "   Energy Consumed: %.2f J\n"
+        "   Carbon Footprint: %.6f g CO₂e\n"
+        "   Tests Executed: %d\n"
+    )
+    _SAVINGS_TEMPLATE = (
+        "\n💰 SAVINGS ACHIEVED:\n"
+        "   Energy Reduction: %.1f%%\n"
+        "   Carbon Reduction: %.1f%%\n"
+        "   Energy Saved: %.2f J\n"
+        "   Carbon Saved: %.3f mg CO₂e\n"
+    )
+    _FOOTER = "=" * 80 + "\n"
+    
+    # Per-tick progress line, bound once so its format spec is parsed only once
+    _fmt_executing = "\n🔄 Executing: {}".format
+    
     def __init__(self):
         self.grid_intensity = 400  # g CO₂/kWh
         self.cpu_watts = 30
         self.memory_watts_per_gb = 0.372
-        self.current_metrics = {
-            'sustainable': {'energy': 0, 'carbon': 0, 'tests_run': 0},
-            'wasteful': {'energy': 0, 'carbon': 0, 'tests_run': 0}
+        # Running totals per framework, indexed by [ENERGY, CARBON, TESTS]
+        self._sustainable = np.zeros(3)
+        self._wasteful = np.zeros(3)
+        
+        # Reports folder in the project root (one level up from Demo), resolved once
+        self._reports_dir = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Reports')
+        os.makedirs(self._reports_dir, exist_ok=True)
+        self._events_file = os.path.join(self._reports_dir, 'simulation_events.jsonl')
+        
+    @staticmethod
+    def _json_line(obj):
+        """Encode one event as a UTF-8 JSON line"""
+        if orjson is not None:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+        return json.dumps(obj).encode('utf-8') + b"\n"
+    
+    @staticmethod
+    def _metrics_dict(totals):
+        """Build the reporting dict for one framework's running totals"""
+        return {'energy': float(totals[ENERGY]), 'carbon': float(totals[CARBON]),
+                'tests_run': int(totals[TESTS])}
+    
+    @property
+    def current_metrics(self):
+        """Nested view of the running totals, built on demand for reporting"""
+        return {
+            'sustainable': self._metrics_dict(self._sustainable),
+            'wasteful': self._metrics_dict(self._wasteful)
         }
+    
+    def simulate_test_execution(self, framework_type, test_duration,
+                                cpu_utilization=None, memory_gb=None, network_overhead=None):
+        """Simulate test execution with real-time energy tracking
         
-    def simulate_test_execution(self, framework_type, test_duration):
-        """Simulate test execution with real-time energy tracking"""
+        Resource samples may be passed in pre-drawn; any left as None are drawn here.
+        """
         if framework_type == 'sustainable':
             # Optimized framework uses less CPU and memory
-            cpu_utilization = random.uniform(0.15, 0.25)  # 15-25% CPU
-            memory_gb = random.uniform(0.5, 1.0)  # 0.5-1GB RAM
-            network_efficiency = 0.8  # 80% efficient requests
+            if cpu_utilization is None:
+                cpu_utilization = random.uniform(*self.SUSTAINABLE_CPU_RANGE)
+            if memory_gb is None:
+                memory_gb = random.uniform(*self.SUSTAINABLE_MEMORY_RANGE)
+            network_efficiency = self.SUSTAINABLE_NETWORK_EFFICIENCY
         else:
             # Wasteful framework uses more resources
-            cpu_utilization = random.uniform(0.6, 0.8)   # 60-80% CPU  
-            memory_gb = random.uniform(2.0, 3.5)  # 2-3.5GB RAM
-            network_efficiency = 0.3  # 30% efficient requests
+            if cpu_utilization is None:
+                cpu_utilization = random.uniform(*self.WASTEFUL_CPU_RANGE)
+            if memory_gb is None:
+                memory_gb = random.uniform(*self.WASTEFUL_MEMORY_RANGE)
+            network_efficiency = self.WASTEFUL_NETWORK_EFFICIENCY
             
-        # Calculate energy consumption
-        cpu_energy = (self.cpu_watts * cpu_utilization * test_duration) / 3600  # Wh
-        memory_energy = (self.memory_watts_per_gb * memory_gb * test_duration) / 3600  # Wh
-        
         # Add network overhead for inefficient frameworks
-        network_overhead = 0 if framework_type == 'sustainable' else random.uniform(0.1, 0.2)
-        
-        total_energy_wh = cpu_energy + memory_energy + network_overhead
-        total_energy_joules = total_energy_wh * 3600
+        if framework_type == 'sustainable':
+            network_overhead = 0.0
+        elif network_overhead is None:
+            network_overhead = random.uniform(*self.WASTEFUL_NETWORK_RANGE)
         
-        # Calculate carbon footprint
-        carbon_g_co2e = (total_energy_wh * self.grid_intensity) / 1000
+        # Calculate energy consumption and carbon footprint
+        total_energy_joules, carbon_g_co2e, _ = _compute_metrics(
+            self.cpu_watts, cpu_utilization, self.memory_watts_per_gb, memory_gb,
+            test_duration, network_overhead, self.grid_intensity)
         
+        return self._test_result(total_energy_joules, carbon_g_co2e, test_duration,
+                                 cpu_utilization, memory_gb, network_efficiency)
+    
+    @staticmethod
+    def _test_result(energy_joules, carbon_g_co2e, duration, cpu_utilization, memory_gb,
+                     network_efficiency):
+        """Build the per-test result dict"""
         return {
-            'energy_joules': total_energy_joules,
-            'carbon_g_co2e': carbon_g_co2e,
-            'duration_seconds': test_duration,
-            'cpu_utilization': cpu_utilization,
-            'memory_gb': memory_gb,
+            'energy_joules': float(energy_joules),
+            'carbon_g_co2e': float(carbon_g_co2e),
+            'duration_seconds': float(duration),
+            'cpu_utilization': float(cpu_utilization),
+            'memory_gb': float(memory_gb),
             'network_efficiency': network_efficiency
         }
     
-    def display_dashboard(self):
-        """Display real-time dashboard"""
-        print("\n" + "="*80)
-        print("🌱 NETZERO TESTOPS - REAL-TIME CARBON DASHBOARD 🌱")
-        print("="*80)
+    def display_dashboard(self, now_dt=None):
+        """Display real-time dashboard
         
-        print(f"📊 Test Execution Summary (Updated: {datetime.now().strftime('%H:%M:%S')})")
-        print("-" * 80)
+        now_dt is the current tick's time; it is looked up here only when not supplied.
+        """
+        if now_dt is None:
+            now_dt = datetime.now()
         
         # Display current metrics
-        sustainable = self.current_metrics['sustainable']
-        wasteful = self.current_metrics['wasteful']
+        current_metrics = self.current_metrics
+        sustainable = current_metrics['sustainable']
+        wasteful = current_metrics['wasteful']
         
-        print(f"🟢 Sustainable Framework:")
-        print(f"   Energy Consumed: {sustainable['energy']:.2f} J")
-        print(f"   Carbon Footprint: {sustainable['carbon']:.6f} g CO₂e")
-        print(f"   Tests Executed: {sustainable['tests_run']}")
-        
-        print(f"\n🔴 Wasteful Framework:")
-        print(f"   Energy Consumed: {wasteful['energy']:.2f} J") 
-        print(f"   Carbon Footprint: {wasteful['carbon']:.6f} g CO₂e")
-        print(f"   Tests Executed: {wasteful['tests_run']}")
+        frame = self._TEMPLATE % (
+            now_dt.strftime('%H:%M:%S'),
+            sustainable['energy'], sustainable['carbon'], sustainable['tests_run'],
+            wasteful['energy'], wasteful['carbon'], wasteful['tests_run'])
         
         # Calculate and display savings
         if wasteful['energy'] > 0:
-            energy_savings = ((wasteful['energy'] - sustainable['energy']) / wasteful['energy']) * 100
-            carbon_savings = ((wasteful['carbon'] - sustainable['carbon']) / wasteful['carbon']) * 100
-            
-            print(f"\n💰 SAVINGS ACHIEVED:")
-            print(f"   Energy Reduction: {energy_savings:.1f}%")
-            print(f"   Carbon Reduction: {carbon_savings:.1f}%")
-            print(f"   Energy Saved: {wasteful['energy'] - sustainable['energy']:.2f} J")
-            print(f"   Carbon Saved: {(wasteful['carbon'] - sustainable['carbon'])*1000:.3f} mg CO₂e")
+            energy_saved = wasteful['energy'] - sustainable['energy']
+            carbon_saved = wasteful['carbon'] - sustainable['carbon']
+            frame += self._SAVINGS_TEMPLATE % (
+                (energy_saved / wasteful['energy']) * 100,
+                (carbon_saved / wasteful['carbon']) * 100,
+                energy_saved,
+                carbon_saved * 1000)
         
-        print("=" * 80)
+        # Emit the whole frame in a single write
+        sys.stdout.write(frame + self._FOOTER)
     
-    def run_simulation(self, duration_minutes=2):
-        """Run the dashboard simulation"""
+    def run_simulation(self, duration_minutes=2, realtime=True):
+        """Run the dashboard simulation
+        
+        All test results for the window are computed up front. With realtime=True they
+        are replayed with demo pacing and live redraws until the window elapses; with
+        realtime=False every test is recorded immediately and only the final totals shown.
+        """
         print("🚀 Starting NetZero TestOps Dashboard Simulation...")
         print(f"⏱️  Running for {duration_minutes} minutes")
         
         start_time = time.time()
         end_time = start_time + (duration_minutes * 60)
+        # Every event line carries these so runs appended to the same file stay separable
+        run_id = uuid.uuid4().hex
+        run_started = datetime.fromtimestamp(start_time).isoformat()
         
-        test_scenarios = [
-            "User Login Test",
-            "Product Search Test", 
-            "Cart Functionality Test",
-            "Checkout Process Test",
-            "Payment Integration Test",
-            "Order Confirmation Test"
-        ]
-        
-        while time.time() < end_time:
-            # Simulate test execution for both frameworks
-            test_name = random.choice(test_scenarios)
-            test_duration = random.uniform(3, 8)  # 3-8 second tests
-            
-            print(f"\n🔄 Executing: {test_name}")
-            
-            # Run on both frameworks
-            sustainable_result = self.simulate_test_execution('sustainable', test_duration)
-            wasteful_result = self.simulate_test_execution('wasteful', test_duration)
-            
-            # Update metrics
-            self.current_metrics['sustainable']['energy'] += sustainable_result['energy_joules']
-            self.current_metrics['sustainable']['carbon'] += sustainable_result['carbon_g_co2e']
-            self.current_metrics['sustainable']['tests_run'] += 1
-            
-            self.current_metrics['wasteful']['energy'] += wasteful_result['energy_joules']
-            self.current_metrics['wasteful']['carbon'] += wasteful_result['carbon_g_co2e'] 
-            self.current_metrics['wasteful']['tests_run'] += 1
-            
-            # Display updated dashboard
+        # Pre-draw every random sample for the simulation window in one shot;
+        # each tick sleeps at least TEST_INTERVAL_RANGE[0] seconds, which bounds the tick count
+        max_ticks = int(duration_minutes * 60 / self.TEST_INTERVAL_RANGE[0]) + 1
+        rng = np.random.default_rng()
+        scenario_indices = rng.integers(0, len(_TEST_SCENARIOS), max_ticks)
+        test_durations = rng.uniform(*self.TEST_DURATION_RANGE, max_ticks)
+        sustainable_cpu = rng.uniform(*self.SUSTAINABLE_CPU_RANGE, max_ticks)
+        sustainable_memory = rng.uniform(*self.SUSTAINABLE_MEMORY_RANGE, max_ticks)
+        wasteful_cpu = rng.uniform(*self.WASTEFUL_CPU_RANGE, max_ticks)
+        wasteful_memory = rng.uniform(*self.WASTEFUL_MEMORY_RANGE, max_ticks)
+        wasteful_network = rng.uniform(*self.WASTEFUL_NETWORK_RANGE, max_ticks)
+        sleep_intervals = rng.uniform(*self.TEST_INTERVAL_RANGE, max_ticks)
+        
+        # Compute every test result for both frameworks in one vectorized pass
+        sustainable_energy, sustainable_carbon, _ = _compute_metrics(
+            self.cpu_watts, sustainable_cpu, self.memory_watts_per_gb, sustainable_memory,
+            test_durations, 0.0, self.grid_intensity)
+        wasteful_energy, wasteful_carbon, _ = _compute_metrics(
+            self.cpu_watts, wasteful_cpu, self.memory_watts_per_gb, wasteful_memory,
+            test_durations, wasteful_network, self.grid_intensity)
+        
+        if realtime:
+            tick_limit = max_ticks
+        else:
+            # Replay the same window without waiting: a test runs when the sleeps before it
+            # (its start offset) still fall inside duration_minutes, as in realtime mode
+            tick_limit = min(max_ticks, 1 + int(np.searchsorted(np.cumsum(sleep_intervals),
+                                                                duration_minutes * 60)))
+        
+        tick = 0
+        # Per-test events are appended as JSON lines (one per executed test, tagged with the run)
+        with open(self._events_file, 'ab') as events_fh:
+            while tick < tick_limit and (not realtime or time.time() < end_time):
+                test_name = _TEST_SCENARIOS[scenario_indices[tick]]
+                
+                if realtime:
+                    print(self._fmt_executing(test_name))
+                    
+                    # Update running metrics for the live display
+                    self._sustainable[ENERGY] += sustainable_energy[tick]
+                    self._sustainable[CARBON] += sustainable_carbon[tick]
+                    self._sustainable[TESTS] += 1
+                    
+                    self._wasteful[ENERGY] += wasteful_energy[tick]
+                    self._wasteful[CARBON] += wasteful_carbon[tick]
+                    self._wasteful[TESTS] += 1
+                
+                # Stream this test's results; the summary is only written at the end
+                events_fh.write(self._json_line({
+                    'run_id': run_id,
+                    'run_started': run_started,
+                    'test_name': test_name,
+                    'sustainable': self._test_result(
+                        sustainable_energy[tick], sustainable_carbon[tick], test_durations[tick],
+                        sustainable_cpu[tick], sustainable_memory[tick],
+                        self.SUSTAINABLE_NETWORK_EFFICIENCY),
+                    'wasteful': self._test_result(
+                        wasteful_energy[tick], wasteful_carbon[tick], test_durations[tick],
+                        wasteful_cpu[tick], wasteful_memory[tick],
+                        self.WASTEFUL_NETWORK_EFFICIENCY)
+                }))
+                tick += 1
+                
+                if not realtime:
+                    continue
+                
+                # Display updated dashboard (ticks are already TEST_INTERVAL_RANGE seconds apart)
+                self.display_dashboard(datetime.now())
+                
+                # Wait before next test
+                time.sleep(sleep_intervals[tick - 1])
+        
+        if not realtime:
+            # Totals via NumPy's pairwise summation: faster and more accurate than a running sum
+            self._sustainable += (sustainable_energy[:tick].sum(), sustainable_carbon[:tick].sum(), tick)
+            self._wasteful += (wasteful_energy[:tick].sum(), wasteful_carbon[:tick].sum(), tick)
+            # Replays skip the per-tick redraws, so show the final totals once
             self.display_dashboard()
-            
-            # Wait before next test
-            time.sleep(random.uniform(2, 4))
         
         # Save final results
         self.save_simulation_results()
@@ -142,33 +305,33 @@ class CarbonDashboardSimulator:
     
     def save_simulation_results(self):
         """Save simulation results to file"""
+        current_metrics = self.current_metrics
+        sustainable = current_metrics['sustainable']
+        wasteful = current_metrics['wasteful']
+        
         results = {
             'timestamp': datetime.now().isoformat(),
             'simulation_summary': {
-                'total_tests_per_framework': self.current_metrics['sustainable']['tests_run'],
-                'sustainable_framework': self.current_metrics['sustainable'],
-                'wasteful_framework': self.current_metrics['wasteful'],
+                'total_tests_per_framework': sustainable['tests_run'],
+                'sustainable_framework': sustainable,
+                'wasteful_framework': wasteful,
                 'savings': {
-                    'energy_reduction_percent': ((self.current_metrics['wasteful']['energy'] - self.current_metrics['sustainable']['energy']) / self.current_metrics['wasteful']['energy']) * 100,
-                    'carbon_reduction_percent': ((self.current_metrics['wasteful']['carbon'] - self.current_metrics['sustainable']['carbon']) / self.current_metrics['wasteful']['carbon']) * 100,
-                    'energy_saved_joules': self.current_metrics['wasteful']['energy'] - self.current_metrics['sustainable']['energy'],
-                    'carbon_saved_g_co2e': self.current_metrics['wasteful']['carbon'] - self.current_metrics['sustainable']['carbon']
+                    'energy_reduction_percent': ((wasteful['energy'] - sustainable['energy']) / wasteful['energy']) * 100,
+                    'carbon_reduction_percent': ((wasteful['carbon'] - sustainable['carbon']) / wasteful['carbon']) * 100,
+                    'energy_saved_joules': wasteful['energy'] - sustainable['energy'],
+                    'carbon_saved_g_co2e': wasteful['carbon'] - sustainable['carbon']
                 }
             }
         }
         
-        # Get the script's directory and create proper path to Reports folder
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(script_dir)  # Go up one level from Demo to NetZero TestOps
-        reports_dir = os.path.join(project_root, 'Reports')
-        
-        # Create Reports directory if it doesn't exist
-        os.makedirs(reports_dir, exist_ok=True)
-        
         # Save the results file
-        results_file = os.path.join(reports_dir, 'simulation_results.json')
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        results_file = os.path.join(self._reports_dir, 'simulation_results.json')
+        if orjson is not None:
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(results, f, indent=2)
             
         print(f"💾 Results saved to: {results_file}")
 
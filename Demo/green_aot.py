@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the demo's energy/carbon kernel
+
+Compiles the kernel from netzero_demo.py with numba.pycc into the ``green_kernels``
+extension module next to this file:
+
+    cd Demo && python green_aot.py
+
+netzero_demo.py imports ``green_kernels`` when it is present and otherwise runs the
+kernel as plain Python; Numba is only needed here, at build time. The built extension
+is platform specific and is not committed, so run this once per environment.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from netzero_demo import _energy_carbon_py
+
+cc = CC('green_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Scalar entry point used per test, array entry point used for whole scenario tables
+cc.export('energy_carbon', 'UniTuple(f8, 2)(f8, f8)')(_energy_carbon_py)
+cc.export('energy_carbon_batch', 'UniTuple(f8[:], 2)(f8[:], f8[:])')(_energy_carbon_py)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built green_kernels in {cc.output_dir}")
@@ -5,11 +5,55 @@ Advanced calculator for measuring and projecting carbon impact of testing framew
 """
 
 import json
-import math
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+# numpy, numba and orjson are imported where they are used so that importing this
+# module (or running the CLI) does not pay their import cost up front
+if TYPE_CHECKING:
+    import numpy as np
+
+@lru_cache(maxsize=None)
+def _compare_kernel():
+    """Return the parallel Numba comparison kernel, or None when numba is not installed"""
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional - large reports use the NumPy path instead
+        return None
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def compare_kernel(k_cpu, k_mem, k_storage, k_net, k_carbon,
+                       dur_s, cpu_s, mem_s, sto_s, net_s,
+                       dur_w, cpu_w, mem_w, sto_w, net_w,
+                       out_e_save, out_c_save, out_e_red, out_c_red):
+        """Per-scenario savings and reduction percentages, threaded across scenarios"""
+        for i in prange(dur_s.shape[0]):
+            sustainable_energy = dur_s[i] * (k_cpu * cpu_s[i] + k_mem * mem_s[i] +
+                                             k_storage * sto_s[i] + k_net * net_s[i])
+            wasteful_energy = dur_w[i] * (k_cpu * cpu_w[i] + k_mem * mem_w[i] +
+                                          k_storage * sto_w[i] + k_net * net_w[i])
+            sustainable_carbon = sustainable_energy * k_carbon
+            wasteful_carbon = wasteful_energy * k_carbon
+            
+            out_e_save[i] = wasteful_energy - sustainable_energy
+            out_c_save[i] = wasteful_carbon - sustainable_carbon
+            out_e_red[i] = (out_e_save[i] / wasteful_energy) * 100
+            out_c_red[i] = (out_c_save[i] / wasteful_carbon) * 100
+    
+    return compare_kernel
 
 class CarbonImpactCalculator:
+    # Scenario metric fields, in the column order used for vectorized calculations
+    METRIC_FIELDS = ('duration_seconds', 'cpu_utilization', 'memory_gb', 'storage_gb', 'network_mb')
+    
+    # Below this many scenarios thread start-up outweighs the parallel kernel's gains
+    PARALLEL_SCENARIO_THRESHOLD = 1000
+    
+    # Annual projection constants
+    PROJECTION_DAYS = 365
+    _KWH_PER_JOULE = 1 / 3_600_000
+
     def __init__(self):
         # Standard emission factors (based on industry averages)
         self.GRID_INTENSITY = 400  # g CO₂/kWh (US average)
@@ -25,10 +69,37 @@ class CarbonImpactCalculator:
         self.ENERGY_COST_PER_KWH = 0.12  # USD per kWh
         self.CARBON_CREDIT_COST_PER_TON = 25  # USD per ton CO₂e
         
+        # Folded coefficients: joules per second (PUE included) per unit of each resource,
+        # and grams CO₂e per joule, so totals reduce to one multiply-add per component
+        self._k_cpu_j = self.CPU_BASE_WATTS * self.CLOUD_PUE
+        self._k_mem_j = self.MEMORY_WATTS_PER_GB * self.CLOUD_PUE
+        self._k_storage_j = self.STORAGE_WATTS_PER_GB * self.CLOUD_PUE
+        self._k_net_j = self.NETWORK_WATTS_PER_MB * self.CLOUD_PUE
+        self._k_carbon_per_j = self.GRID_INTENSITY / 3_600_000
+        
+    def _energy_carbon_scalars(self, duration_seconds: float, cpu_utilization: float,
+                               memory_gb: float, storage_gb: float = 0,
+                               network_mb: float = 0) -> Tuple[float, float]:
+        """Calculate total energy (J, incl. PUE) and carbon (g CO₂e) without building a result dict"""
+        energy_joules = duration_seconds * (self._k_cpu_j * cpu_utilization +
+                                            self._k_mem_j * memory_gb +
+                                            self._k_storage_j * storage_gb +
+                                            self._k_net_j * network_mb)
+        return energy_joules, energy_joules * self._k_carbon_per_j
+    
     def calculate_base_consumption(self, duration_seconds: float, cpu_utilization: float, 
                                  memory_gb: float, storage_gb: float = 0, 
-                                 network_mb: float = 0) -> Dict:
-        """Calculate base energy consumption and carbon footprint"""
+                                 network_mb: float = 0,
+                                 detail: bool = True) -> Union[Dict, Tuple[float, float]]:
+        """Calculate base energy consumption and carbon footprint
+        
+        With detail=False only the (energy_joules, carbon_g_co2e) totals are returned.
+        """
+        
+        if not detail:
+            # Totals only (incl. cloud PUE factor), without building the nested dict
+            return self._energy_carbon_scalars(
+                duration_seconds, cpu_utilization, memory_gb, storage_gb, network_mb)
         
         # Convert duration to hours for energy calculations
         duration_hours = duration_seconds / 3600
@@ -39,10 +110,8 @@ class CarbonImpactCalculator:
         storage_energy = self.STORAGE_WATTS_PER_GB * storage_gb * duration_hours
         network_energy = self.NETWORK_WATTS_PER_MB * network_mb * duration_hours
         
-        # Total energy consumption
+        # Total energy consumption, with the cloud PUE factor applied
         total_energy_wh = cpu_energy + memory_energy + storage_energy + network_energy
-        
-        # Apply cloud PUE factor (accounts for cooling, power distribution losses)
         total_energy_with_pue_wh = total_energy_wh * self.CLOUD_PUE
         
         # Convert to other units
@@ -80,66 +149,137 @@ class CarbonImpactCalculator:
             }
         }
     
+    def _vectorized_consumption(self, arr_duration: 'np.ndarray', arr_cpu: 'np.ndarray',
+                                arr_mem: 'np.ndarray', arr_storage: 'np.ndarray',
+                                arr_net: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """Calculate energy (J) and carbon (g CO₂e) for many scenarios at once"""
+        
+        # Same model as _energy_carbon_scalars, applied elementwise
+        energy_joules = arr_duration * (self._k_cpu_j * arr_cpu +
+                                        self._k_mem_j * arr_mem +
+                                        self._k_storage_j * arr_storage +
+                                        self._k_net_j * arr_net)
+        return energy_joules, energy_joules * self._k_carbon_per_j
+    
+    def _stack_metrics(self, metrics: List[Dict]) -> 'np.ndarray':
+        """Stack per-scenario metric dicts into one float64 row per metric field"""
+        import numpy as np
+        
+        # Duration, CPU and memory are required (KeyError, as calculate_base_consumption
+        # would raise); storage and network default to 0 like its keyword arguments
+        return np.array([(m['duration_seconds'], m['cpu_utilization'], m['memory_gb'],
+                          m.get('storage_gb', 0), m.get('network_mb', 0)) for m in metrics],
+                        dtype=np.float64).reshape(-1, len(self.METRIC_FIELDS)).T
+    
+    def _compare_scenarios(self, sustainable: 'np.ndarray',
+                           wasteful: 'np.ndarray') -> Tuple['np.ndarray', ...]:
+        """Return per-scenario (energy_saved, carbon_saved, energy_reduction %, carbon_reduction %)"""
+        import numpy as np
+        
+        # Only reach for numba (and its import/JIT cost) for reports large enough to benefit
+        kernel = (_compare_kernel() if sustainable.shape[1] >= self.PARALLEL_SCENARIO_THRESHOLD
+                  else None)
+        if kernel is not None:
+            results = tuple(np.empty(sustainable.shape[1]) for _ in range(4))
+            kernel(self._k_cpu_j, self._k_mem_j, self._k_storage_j, self._k_net_j,
+                   self._k_carbon_per_j, *sustainable, *wasteful, *results)
+            return results
+        
+        sustainable_energy, sustainable_carbon = self._vectorized_consumption(*sustainable)
+        wasteful_energy, wasteful_carbon = self._vectorized_consumption(*wasteful)
+        energy_saved = wasteful_energy - sustainable_energy
+        carbon_saved = wasteful_carbon - sustainable_carbon
+        return (energy_saved, carbon_saved,
+                (energy_saved / wasteful_energy) * 100, (carbon_saved / wasteful_carbon) * 100)
+    
     def calculate_framework_comparison(self, sustainable_metrics: Dict, 
-                                     wasteful_metrics: Dict) -> Dict:
-        """Compare two testing frameworks and calculate improvements"""
+                                     wasteful_metrics: Dict, timestamp: Optional[str] = None,
+                                     detail: bool = True) -> Dict:
+        """Compare two testing frameworks and calculate improvements
         
-        # Calculate consumption for both frameworks
-        sustainable_result = self.calculate_base_consumption(**sustainable_metrics)
-        wasteful_result = self.calculate_base_consumption(**wasteful_metrics)
+        Batch callers can pass a shared ISO timestamp instead of one being taken per call.
+        With detail=False the per-framework consumption breakdowns are left out.
+        """
+        
+        # Calculate consumption for both frameworks: the nested breakdowns only for
+        # output-facing callers (totals are read back from them), bare totals otherwise
+        if detail:
+            sustainable_result = self.calculate_base_consumption(**sustainable_metrics)
+            wasteful_result = self.calculate_base_consumption(**wasteful_metrics)
+            sustainable_energy = sustainable_result['energy']['total_joules']
+            sustainable_carbon = sustainable_result['carbon']['total_g_co2e']
+            wasteful_energy = wasteful_result['energy']['total_joules']
+            wasteful_carbon = wasteful_result['carbon']['total_g_co2e']
+        else:
+            sustainable_energy, sustainable_carbon = self.calculate_base_consumption(
+                **sustainable_metrics, detail=False)
+            wasteful_energy, wasteful_carbon = self.calculate_base_consumption(
+                **wasteful_metrics, detail=False)
+        
+        # Calculate absolute savings
+        energy_saved_joules = wasteful_energy - sustainable_energy
+        carbon_saved_g_co2e = wasteful_carbon - sustainable_carbon
         
         # Calculate improvements
-        energy_reduction = ((wasteful_result['energy']['total_joules'] - 
-                           sustainable_result['energy']['total_joules']) / 
-                          wasteful_result['energy']['total_joules']) * 100
+        energy_reduction = (energy_saved_joules / wasteful_energy) * 100
+        carbon_reduction = (carbon_saved_g_co2e / wasteful_carbon) * 100
         
-        carbon_reduction = ((wasteful_result['carbon']['total_g_co2e'] - 
-                           sustainable_result['carbon']['total_g_co2e']) / 
-                          wasteful_result['carbon']['total_g_co2e']) * 100
+        return self._build_comparison(
+            sustainable_metrics, wasteful_metrics,
+            timestamp if timestamp is not None else datetime.now().isoformat(),
+            energy_saved_joules, carbon_saved_g_co2e, energy_reduction, carbon_reduction,
+            sustainable_result if detail else None, wasteful_result if detail else None)
+    
+    def _build_comparison(self, sustainable_metrics: Dict, wasteful_metrics: Dict, timestamp: str,
+                          energy_saved_joules: float, carbon_saved_g_co2e: float,
+                          energy_reduction: float, carbon_reduction: float,
+                          sustainable_result: Optional[Dict] = None,
+                          wasteful_result: Optional[Dict] = None) -> Dict:
+        """Assemble a comparison dict from already computed savings and reductions"""
         
         performance_improvement = ((wasteful_metrics['duration_seconds'] - 
                                   sustainable_metrics['duration_seconds']) / 
                                  wasteful_metrics['duration_seconds']) * 100
         
-        # Calculate absolute savings
-        energy_saved_joules = (wasteful_result['energy']['total_joules'] - 
-                              sustainable_result['energy']['total_joules'])
-        carbon_saved_g_co2e = (wasteful_result['carbon']['total_g_co2e'] - 
-                              sustainable_result['carbon']['total_g_co2e'])
-        
-        return {
-            'timestamp': datetime.now().isoformat(),
+        comparison = {
+            'timestamp': timestamp,
             'comparison_summary': {
                 'energy_reduction_percent': energy_reduction,
                 'carbon_reduction_percent': carbon_reduction,
                 'performance_improvement_percent': performance_improvement,
                 'energy_saved_joules': energy_saved_joules,
                 'carbon_saved_g_co2e': carbon_saved_g_co2e
-            },
-            'sustainable_framework': sustainable_result,
-            'wasteful_framework': wasteful_result,
-            'efficiency_analysis': {
-                'cpu_efficiency_improvement': ((wasteful_metrics['cpu_utilization'] - 
-                                              sustainable_metrics['cpu_utilization']) / 
-                                             wasteful_metrics['cpu_utilization']) * 100,
-                'memory_efficiency_improvement': ((wasteful_metrics['memory_gb'] - 
-                                                 sustainable_metrics['memory_gb']) / 
-                                                wasteful_metrics['memory_gb']) * 100
             }
         }
+        
+        # The nested per-framework breakdowns are only attached for output-facing callers
+        if sustainable_result is not None:
+            comparison['sustainable_framework'] = sustainable_result
+            comparison['wasteful_framework'] = wasteful_result
+        
+        comparison['efficiency_analysis'] = {
+            'cpu_efficiency_improvement': ((wasteful_metrics['cpu_utilization'] - 
+                                          sustainable_metrics['cpu_utilization']) / 
+                                         wasteful_metrics['cpu_utilization']) * 100,
+            'memory_efficiency_improvement': ((wasteful_metrics['memory_gb'] - 
+                                             sustainable_metrics['memory_gb']) / 
+                                            wasteful_metrics['memory_gb']) * 100
+        }
+        
+        return comparison
     
     def calculate_annual_projections(self, daily_tests: int, comparison_result: Dict) -> Dict:
         """Calculate annual carbon and cost savings projections"""
         
+        summary = comparison_result['comparison_summary']
+        
         # Daily savings
-        daily_energy_saved_kwh = (comparison_result['comparison_summary']['energy_saved_joules'] * 
-                                 daily_tests) / 3600000  # Convert J to kWh
-        daily_carbon_saved_kg = (comparison_result['comparison_summary']['carbon_saved_g_co2e'] * 
-                                daily_tests) / 1000  # Convert g to kg
-        
-        # Annual projections (365 days)
-        annual_energy_saved_kwh = daily_energy_saved_kwh * 365
-        annual_carbon_saved_kg = daily_carbon_saved_kg * 365
+        daily_energy_saved_kwh = summary['energy_saved_joules'] * daily_tests * self._KWH_PER_JOULE
+        daily_carbon_saved_kg = (summary['carbon_saved_g_co2e'] * daily_tests) / 1000  # Convert g to kg
+        
+        # Annual projections
+        annual_energy_saved_kwh = daily_energy_saved_kwh * self.PROJECTION_DAYS
+        annual_carbon_saved_kg = daily_carbon_saved_kg * self.PROJECTION_DAYS
         annual_carbon_saved_tons = annual_carbon_saved_kg / 1000
         
         # Cost savings
@@ -150,7 +290,7 @@ class CarbonImpactCalculator:
         return {
             'projection_parameters': {
                 'daily_tests': daily_tests,
-                'projection_days': 365,
+                'projection_days': self.PROJECTION_DAYS,
                 'energy_cost_per_kwh': self.ENERGY_COST_PER_KWH,
                 'carbon_credit_cost_per_ton': self.CARBON_CREDIT_COST_PER_TON
             },
@@ -172,28 +312,25 @@ class CarbonImpactCalculator:
             }
         }
     
-    def generate_carbon_report(self, test_scenarios: List[Dict]) -> Dict:
-        """Generate comprehensive carbon impact report"""
+    def generate_carbon_report(self, test_scenarios: List[Dict], include_details: bool = True) -> Dict:
+        """Generate comprehensive carbon impact report
         
-        total_comparisons = []
+        With include_details=False the per-scenario comparisons omit the nested
+        per-framework consumption breakdowns.
+        """
         
-        for scenario in test_scenarios:
-            comparison = self.calculate_framework_comparison(
-                scenario['sustainable_metrics'],
-                scenario['wasteful_metrics']
-            )
-            comparison['scenario_name'] = scenario['name']
-            total_comparisons.append(comparison)
+        # One timestamp is shared by the report and all of its scenario comparisons
+        timestamp = datetime.now().isoformat()
         
-        # Calculate aggregated metrics
-        total_energy_saved = sum(c['comparison_summary']['energy_saved_joules'] 
-                               for c in total_comparisons)
-        total_carbon_saved = sum(c['comparison_summary']['carbon_saved_g_co2e'] 
-                               for c in total_comparisons)
-        avg_carbon_reduction = sum(c['comparison_summary']['carbon_reduction_percent'] 
-                                 for c in total_comparisons) / len(total_comparisons)
-        avg_energy_reduction = sum(c['comparison_summary']['energy_reduction_percent'] 
-                                 for c in total_comparisons) / len(total_comparisons)
+        # Calculate aggregated metrics over all scenarios in one vectorized pass
+        energy_saved, carbon_saved, energy_reduction, carbon_reduction = self._compare_scenarios(
+            self._stack_metrics([s['sustainable_metrics'] for s in test_scenarios]),
+            self._stack_metrics([s['wasteful_metrics'] for s in test_scenarios]))
+        
+        total_energy_saved = float(energy_saved.sum())
+        total_carbon_saved = float(carbon_saved.sum())
+        avg_carbon_reduction = float(carbon_reduction.mean())
+        avg_energy_reduction = float(energy_reduction.mean())
         
         # Generate annual projections (assuming 100 tests per day)
         mock_comparison = {
@@ -204,9 +341,28 @@ class CarbonImpactCalculator:
         }
         annual_projections = self.calculate_annual_projections(100, mock_comparison)
         
+        # Per-scenario comparisons reuse the vectorized savings/reductions; only the nested
+        # breakdowns (when requested) go through calculate_base_consumption
+        total_comparisons = []
+        for scenario, e_saved, c_saved, e_red, c_red in zip(
+                test_scenarios, energy_saved.tolist(), carbon_saved.tolist(),
+                energy_reduction.tolist(), carbon_reduction.tolist()):
+            sustainable_metrics = scenario['sustainable_metrics']
+            wasteful_metrics = scenario['wasteful_metrics']
+            if include_details:
+                sustainable_result = self.calculate_base_consumption(**sustainable_metrics)
+                wasteful_result = self.calculate_base_consumption(**wasteful_metrics)
+            else:
+                sustainable_result = wasteful_result = None
+            comparison = self._build_comparison(
+                sustainable_metrics, wasteful_metrics, timestamp,
+                e_saved, c_saved, e_red, c_red, sustainable_result, wasteful_result)
+            comparison['scenario_name'] = scenario['name']
+            total_comparisons.append(comparison)
+        
         return {
             'report_metadata': {
-                'generated_timestamp': datetime.now().isoformat(),
+                'generated_timestamp': timestamp,
                 'scenarios_analyzed': len(test_scenarios),
                 'calculator_version': '1.0.0'
             },
@@ -298,9 +454,17 @@ def main():
     
     # Save report to file
     import os
+    try:
+        import orjson
+    except ImportError:  # orjson is optional - fall back to the stdlib json module
+        orjson = None
     os.makedirs('../Reports', exist_ok=True)
-    with open('../Reports/carbon_impact_analysis.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open('../Reports/carbon_impact_analysis.json', 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('../Reports/carbon_impact_analysis.json', 'w') as f:
+            json.dump(report, f, indent=2)
     
     # Display summary
     print("\n📊 CARBON IMPACT ANALYSIS COMPLETE")
@@ -9,182 +9,353 @@ It showcases real carbon calculation and measurement techniques used in our
 hackathon submission.
 """
 
+import io
 import json
+import sys
 import time
 import os
 import datetime
-from typing import Dict, List, Tuple
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - batch columns then fall back to tuples and sum()
+    np = None
+
+try:
+    # Ahead-of-time compiled kernels (built by green_aot.py)
+    import green_kernels
+except ImportError:  # the extension is optional - the kernel below then runs as plain Python
+    green_kernels = None
+
+# Grid intensity factors (g CO2/kWh) - global average
+GRID_INTENSITY = 400.0  # grams CO2 per kWh
+
+# Hardware power consumption estimates
+CPU_POWER_WATTS = 30.0  # Average CPU power consumption
+MEMORY_POWER_PER_GB = 0.372  # Watts per GB of memory
+
+# Skip the simulated delays (NETZERO_FAST=1/true/yes) for CI and benchmark runs; unset, "0",
+# "false" and "no" keep them
+FAST_MODE = os.environ.get('NETZERO_FAST', '').strip().lower() not in ('', '0', 'false', 'no')
+
+# Per-test console lines, %-formatted in the suite loops
+_FMT_EXECUTING = "🔧 Executing %s...\n"
+_FMT_RESULT = "   ⚡ Duration: %.2fs | Energy: %.4fJ | CO₂: %.6fg\n"
+_FMT_REDUNDANT = "   ⚠️  Redundant iteration %d (wasteful)\n"
+_FMT_NEW_CLIENT = "   ❌ Creating new HTTP client (iteration %d)\n"
+_FMT_READ_CONFIG = "   ❌ Reading configuration from file (iteration %d)\n"
+
+# Joules -> kWh -> g CO2e folded into one multiplier (avoids two divisions per test)
+_INV_J_TO_KWH_TIMES_GI = GRID_INTENSITY / (3600.0 * 1000.0)
+
+# Reused by the stdlib fallback: json.dumps(indent=2) would build a new encoder per call
+_JSON_INDENT_2 = json.JSONEncoder(indent=2)
+
+def _dumps_indented(value, level: int) -> str:
+    """Pretty-print a JSON value as if nested `level` indents deep (json indent=2 layout)"""
+    if orjson is not None:
+        text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = _JSON_INDENT_2.encode(value)
+    return text.replace('\n', '\n' + '  ' * level) if level else text
+
+def _stream_json(write, value, level: int = 0):
+    """Write value as indent=2 JSON, walking dicts and streaming iterators entry by entry"""
+    if isinstance(value, dict):
+        opener, closer, items = '{', '}', value.items()
+    elif isinstance(value, Iterator):
+        opener, closer, items = '[', ']', ((None, item) for item in value)
+    else:
+        write(_dumps_indented(value, level))
+        return
+    pad = '\n' + '  ' * (level + 1)
+    sep = opener
+    for key, item in items:
+        write(sep + pad)
+        if key is None:
+            # Iterator entries (e.g. log records) are dumped whole in one call
+            write(_dumps_indented(item, level + 1))
+        else:
+            write(json.dumps(key) + ': ')
+            _stream_json(write, item, level + 1)
+        sep = ','
+    write(opener + closer if sep == opener else '\n' + '  ' * level + closer)
+
+def _energy_carbon_py(cpu_time_seconds, memory_gb):
+    """Total energy consumption (Joules) and carbon footprint (grams CO2e)"""
+    energy_joules = cpu_time_seconds * (CPU_POWER_WATTS + memory_gb * MEMORY_POWER_PER_GB)
+    return energy_joules, energy_joules * _INV_J_TO_KWH_TIMES_GI
+
+# Kernel selection: AOT extension, else plain Python. The kernel only evaluates the
+# scenario tables at import time, so a JIT compile would cost more than it saves.
+if green_kernels is not None:
+    _energy_carbon = green_kernels.energy_carbon
+    _energy_carbon_batch = green_kernels.energy_carbon_batch
+else:
+    _energy_carbon = _energy_carbon_batch = _energy_carbon_py
+
+def _total(values) -> float:
+    """Reduce a per-test column (NumPy array or tuple) to a Python float"""
+    return float(values.sum()) if np is not None else sum(values)
 
 class CarbonCalculator:
     """Industry-standard carbon footprint calculator for software testing"""
     
-    # Grid intensity factors (g CO2/kWh) - global average
-    GRID_INTENSITY = 400  # grams CO2 per kWh
-    
-    # Hardware power consumption estimates
-    CPU_POWER_WATTS = 30  # Average CPU power consumption
-    MEMORY_POWER_PER_GB = 0.372  # Watts per GB of memory
+    GRID_INTENSITY = GRID_INTENSITY
+    CPU_POWER_WATTS = CPU_POWER_WATTS
+    MEMORY_POWER_PER_GB = MEMORY_POWER_PER_GB
     
     @classmethod
-    def calculate_energy_consumption(cls, cpu_time_seconds: float, memory_gb: float) -> float:
-        """Calculate total energy consumption in Joules"""
-        cpu_energy_joules = cpu_time_seconds * cls.CPU_POWER_WATTS
-        memory_energy_joules = cpu_time_seconds * memory_gb * cls.MEMORY_POWER_PER_GB
-        return cpu_energy_joules + memory_energy_joules
+    def compute(cls, cpu_time_seconds: float, memory_gb: float) -> Tuple[float, float]:
+        """Calculate energy consumption in Joules and carbon footprint in grams CO2e"""
+        return _energy_carbon(cpu_time_seconds, memory_gb)
     
     @classmethod
-    def calculate_carbon_footprint(cls, energy_joules: float) -> float:
-        """Calculate carbon footprint in grams CO2e"""
-        energy_kwh = energy_joules / 3600 / 1000  # Convert J to kWh
-        return energy_kwh * cls.GRID_INTENSITY
+    def compute_batch(cls, cpu_times: Sequence[float],
+                      memories: Sequence[float]) -> Tuple[Sequence[float], Sequence[float]]:
+        """Energy (Joules) and carbon (grams CO2e) columns for many tests in one kernel call"""
+        if np is not None:
+            return _energy_carbon_batch(np.asarray(cpu_times, dtype=np.float64),
+                                        np.asarray(memories, dtype=np.float64))
+        pairs = [_energy_carbon(cpu, mem) for cpu, mem in zip(cpu_times, memories)]
+        return tuple(pair[0] for pair in pairs), tuple(pair[1] for pair in pairs)
+
+def _scenario_table(rows, overhead: Optional[float] = None):
+    """Scenario rows extended with their energy/carbon columns, plus (energy, carbon, duration) totals"""
+    names, durations, memories = zip(*rows)
+    columns = (names, durations, memories)
+    if overhead is not None:
+        # Rows keep the base duration next to the overhead-inflated values
+        base_durations = durations
+        durations = tuple(duration + overhead for duration in base_durations)
+        memories = tuple(memory + overhead for memory in memories)
+        columns = (names, base_durations, durations, memories)
+    # Per-test energy/carbon columns from one batch kernel call, reduced to suite totals
+    energy, carbon = CarbonCalculator.compute_batch(durations, memories)
+    table = tuple(zip(*columns, map(float, energy), map(float, carbon)))
+    return table, (_total(energy), _total(carbon), sum(durations))
+
+class LogRec(NamedTuple):
+    """A single test execution log entry (field names match the exported JSON keys)"""
+    test: str
+    duration_seconds: float
+    energy_joules: float
+    carbon_g_co2e: float
+    timestamp_offset: float
 
 class TestFrameworkSimulator:
     """Simulates the performance characteristics of different test frameworks"""
     
-    def __init__(self, name: str):
+    __slots__ = ('name', 'execution_logs', 'total_energy', 'total_carbon', 'total_duration',
+                 '_t0_wall', '_t0_mono')
+    
+    def __init__(self, name: str) -> None:
         self.name = name
         self.execution_logs = []
         self.total_energy = 0.0
         self.total_carbon = 0.0
+        self.total_duration = 0.0
+        # Wall-clock anchor for log timestamps; entries store cheap monotonic offsets
+        self._t0_wall = datetime.datetime.now()
+        self._t0_mono = time.monotonic()
+    
+    def _record(self, test_name: str, duration: float, energy: float, carbon: float) -> None:
+        """Append a log entry without touching the running totals"""
+        self.execution_logs.append(
+            LogRec(test_name, duration, energy, carbon, time.monotonic() - self._t0_mono))
     
-    def log_execution(self, test_name: str, duration: float, energy: float, carbon: float):
+    def _add_totals(self, totals: Tuple[float, float, float]) -> None:
+        """Fold precomputed (energy, carbon, duration) suite totals into the running totals"""
+        energy, carbon, duration = totals
+        self.total_energy += energy
+        self.total_carbon += carbon
+        self.total_duration += duration
+    
+    def log_execution(self, test_name: str, duration: float, energy: float, carbon: float) -> None:
         """Log a test execution with its environmental impact"""
-        self.execution_logs.append({
-            'test': test_name,
-            'duration_seconds': duration,
-            'energy_joules': energy,
-            'carbon_g_co2e': carbon,
-            'timestamp': datetime.datetime.now().isoformat()
-        })
+        self._record(test_name, duration, energy, carbon)
         self.total_energy += energy
         self.total_carbon += carbon
+        self.total_duration += duration
+    
+    def iter_logs(self) -> Iterable[Dict]:
+        """Yield the execution logs with ISO timestamps materialized from their offsets"""
+        for log in self.execution_logs:
+            entry = log._asdict()
+            offset = entry.pop('timestamp_offset')
+            entry['timestamp'] = (self._t0_wall + datetime.timedelta(seconds=offset)).isoformat()
+            yield entry
+    
+    def export_logs(self) -> List[Dict]:
+        """Return the execution logs with ISO timestamps materialized from their offsets"""
+        return list(self.iter_logs())
 
 class GreenerFrameworkSimulator(TestFrameworkSimulator):
     """Simulates the optimized Green QA framework"""
     
-    def __init__(self):
+    __slots__ = ('http_client_initialized', 'config_cached')
+    
+    # Scenario inputs are constant, so their impact is computed once at import
+    # (name, duration_s, memory_gb, energy_j, carbon_g)
+    GREEN_SCENARIOS, GREEN_TOTALS = _scenario_table((
+        ("Test_Login", 0.75, 0.5),      # Efficient single execution
+        ("Test_Inventory", 0.85, 0.3),  # Optimized resource usage
+        ("Test_Checkout", 0.95, 0.6)    # Smart parallel execution
+    ))
+    
+    def __init__(self) -> None:
         super().__init__("GreenerTestFramework")
         self.http_client_initialized = False
         self.config_cached = False
     
-    def run_test_suite(self):
+    def run_test_suite(self, stream: Optional[TextIO] = None) -> None:
         """Simulate running the green test suite with optimizations"""
-        print(f"\n🌱 Running {self.name} (GREEN PATTERNS)")
-        print("=" * 60)
+        # Buffer the suite's output and write it once instead of a print per line
+        buf = io.StringIO()
+        emit = buf.write
+        emit(f"\n🌱 Running {self.name} (GREEN PATTERNS)\n")
+        emit("=" * 60 + "\n")
         
         # One-time initialization (HTTP client, config caching)
         if not self.http_client_initialized:
-            print("✅ Initializing shared HTTP client (reused across tests)")
-            time.sleep(0.1)  # Simulate brief initialization
+            emit("✅ Initializing shared HTTP client (reused across tests)\n")
+            if not FAST_MODE:
+                time.sleep(0.1)  # Simulate brief initialization
             self.http_client_initialized = True
         
         if not self.config_cached:
-            print("✅ Caching configuration (read once, reused)")
-            time.sleep(0.05)  # Simulate config read
+            emit("✅ Caching configuration (read once, reused)\n")
+            if not FAST_MODE:
+                time.sleep(0.05)  # Simulate config read
             self.config_cached = True
         
-        # Run optimized tests
-        test_scenarios = [
-            ("Test_Login", 0.75, 0.5),      # Efficient single execution
-            ("Test_Inventory", 0.85, 0.3),  # Optimized resource usage
-            ("Test_Checkout", 0.95, 0.6)    # Smart parallel execution
-        ]
-        
-        for test_name, duration, memory_gb in test_scenarios:
-            print(f"🔧 Executing {test_name}...")
+        # Run optimized tests (environmental impact precomputed in GREEN_SCENARIOS)
+        for test_name, duration, memory_gb, energy, carbon in self.GREEN_SCENARIOS:
+            emit(_FMT_EXECUTING % test_name)
             
             # Simulate efficient test execution
-            time.sleep(duration * 0.1)  # Scaled down for demo
-            
-            # Calculate environmental impact
-            energy = CarbonCalculator.calculate_energy_consumption(duration, memory_gb)
-            carbon = CarbonCalculator.calculate_carbon_footprint(energy)
+            if not FAST_MODE:
+                time.sleep(duration * 0.1)  # Scaled down for demo
             
-            print(f"   ⚡ Duration: {duration:.2f}s | Energy: {energy:.4f}J | CO₂: {carbon:.6f}g")
+            emit(_FMT_RESULT % (duration, energy, carbon))
             
-            self.log_execution(test_name, duration, energy, carbon)
+            self._record(test_name, duration, energy, carbon)
+        self._add_totals(self.GREEN_TOTALS)
         
         # Cleanup (proper resource disposal)
-        print("✅ Disposing resources (HTTP client cleanup)")
-        print(f"\n🌱 {self.name} completed successfully!")
-        print(f"   Total Energy: {self.total_energy:.4f} Joules")
-        print(f"   Total CO₂e: {self.total_carbon:.6f} grams")
+        emit("✅ Disposing resources (HTTP client cleanup)\n")
+        emit(f"\n🌱 {self.name} completed successfully!\n")
+        emit(f"   Total Energy: {self.total_energy:.4f} Joules\n")
+        emit(f"   Total CO₂e: {self.total_carbon:.6f} grams\n")
+        stream = sys.stdout if stream is None else stream
+        stream.write(buf.getvalue())
+        stream.flush()
 
 class NonGreenFrameworkSimulator(TestFrameworkSimulator):
     """Simulates the wasteful anti-pattern framework"""
     
-    def __init__(self):
+    __slots__ = ()
+    
+    # The impact uses the worst-case final iteration (3 x 0.1 overhead on the base values)
+    # (name, base_duration_s, final_duration_s, final_memory_gb, energy_j, carbon_g)
+    WASTEFUL_SCENARIOS, WASTEFUL_TOTALS = _scenario_table((
+        ("Test_Login", 2.35, 0.8),      # Redundant 10x loops
+        ("Test_Inventory", 0.94, 0.4),  # Repeated config reads
+        ("Test_Checkout", 2.85, 0.9)    # New HTTP client per test
+    ), overhead=3 * 0.1)
+    
+    def __init__(self) -> None:
         super().__init__("NonGreenTestFramework")
     
-    def run_test_suite(self):
+    def run_test_suite(self, stream: Optional[TextIO] = None) -> None:
         """Simulate running the wasteful test suite with anti-patterns"""
-        print(f"\n❌ Running {self.name} (WASTEFUL PATTERNS)")
-        print("=" * 60)
+        buf = io.StringIO()
+        emit = buf.write
+        emit(f"\n❌ Running {self.name} (WASTEFUL PATTERNS)\n")
+        emit("=" * 60 + "\n")
         
         # Simulate wasteful redundant test executions
-        test_scenarios = [
-            ("Test_Login", 2.35, 0.8),      # Redundant 10x loops
-            ("Test_Inventory", 0.94, 0.4),  # Repeated config reads
-            ("Test_Checkout", 2.85, 0.9)    # New HTTP client per test
-        ]
-        
-        for test_name, base_duration, base_memory in test_scenarios:
-            print(f"🔧 Executing {test_name}...")
+        for test_name, base_duration, final_duration, final_memory, energy, carbon in self.WASTEFUL_SCENARIOS:
+            emit(_FMT_EXECUTING % test_name)
             
             # Simulate wasteful patterns
             for iteration in range(1, 4):  # Simulate some of the wasteful iterations
                 if iteration > 1:
-                    print(f"   ⚠️  Redundant iteration {iteration} (wasteful)")
+                    emit(_FMT_REDUNDANT % iteration)
                 
                 # Wasteful operations
-                print(f"   ❌ Creating new HTTP client (iteration {iteration})")
-                time.sleep(0.02)  # HTTP client creation overhead
+                emit(_FMT_NEW_CLIENT % iteration)
+                if not FAST_MODE:
+                    time.sleep(0.02)  # HTTP client creation overhead
                 
-                print(f"   ❌ Reading configuration from file (iteration {iteration})")
-                time.sleep(0.01)  # File I/O overhead
+                emit(_FMT_READ_CONFIG % iteration)
+                if not FAST_MODE:
+                    time.sleep(0.01)  # File I/O overhead
                 
-                # Calculate inflated resource usage due to inefficiencies
+                # Inflated duration due to inefficiencies
                 duration = base_duration + (iteration * 0.1)  # Increasing overhead
-                memory_gb = base_memory + (iteration * 0.1)   # Memory leaks
                 
-                time.sleep(duration * 0.05)  # Scaled down for demo
+                if not FAST_MODE:
+                    time.sleep(duration * 0.05)  # Scaled down for demo
             
-            # Calculate environmental impact (using worst-case final iteration)
-            final_duration = base_duration + (3 * 0.1)
-            final_memory = base_memory + (3 * 0.1)
-            energy = CarbonCalculator.calculate_energy_consumption(final_duration, final_memory)
-            carbon = CarbonCalculator.calculate_carbon_footprint(energy)
+            emit(_FMT_RESULT % (final_duration, energy, carbon))
+            emit("   ❌ No resource cleanup (potential memory leaks)\n")
             
-            print(f"   ⚡ Duration: {final_duration:.2f}s | Energy: {energy:.4f}J | CO₂: {carbon:.6f}g")
-            print(f"   ❌ No resource cleanup (potential memory leaks)")
-            
-            self.log_execution(test_name, final_duration, energy, carbon)
+            self._record(test_name, final_duration, energy, carbon)
+        self._add_totals(self.WASTEFUL_TOTALS)
         
-        print(f"\n❌ {self.name} completed with waste!")
-        print(f"   Total Energy: {self.total_energy:.4f} Joules")
-        print(f"   Total CO₂e: {self.total_carbon:.6f} grams")
+        emit(f"\n❌ {self.name} completed with waste!\n")
+        emit(f"   Total Energy: {self.total_energy:.4f} Joules\n")
+        emit(f"   Total CO₂e: {self.total_carbon:.6f} grams\n")
+        stream = sys.stdout if stream is None else stream
+        stream.write(buf.getvalue())
+        stream.flush()
 
 class HackathonDemonstrtor:
     """Main demonstration class for the hackathon"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.green_framework = GreenerFrameworkSimulator()
         self.wasteful_framework = NonGreenFrameworkSimulator()
+        self._improvements = None
     
-    def run_comparative_demo(self):
+    def _compute_improvements(self) -> Dict[str, float]:
+        """Compute the percentage improvements once from the running totals"""
+        baseline, optimized = self.wasteful_framework, self.green_framework
+        self._improvements = {
+            'energy_reduction_percentage': ((baseline.total_energy - optimized.total_energy) / baseline.total_energy) * 100,
+            'carbon_reduction_percentage': ((baseline.total_carbon - optimized.total_carbon) / baseline.total_carbon) * 100,
+            'performance_improvement_percentage': ((baseline.total_duration - optimized.total_duration) / baseline.total_duration) * 100
+        }
+        return self._improvements
+    
+    def run_comparative_demo(self) -> None:
         """Run the complete hackathon demonstration"""
         print("🏆 GREEN QA REVOLUTION - HACKATHON DEMONSTRATION")
         print("=" * 80)
         print("Demonstrating carbon footprint reduction in software testing")
         print("=" * 80)
         
-        # Run baseline (wasteful) framework
-        self.wasteful_framework.run_test_suite()
+        # Run baseline (wasteful) and optimized (green) frameworks concurrently - they share
+        # no state and are sleep-bound - each into its own buffer, written in order
+        wasteful_out, green_out = io.StringIO(), io.StringIO()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self.wasteful_framework.run_test_suite, wasteful_out),
+                       executor.submit(self.green_framework.run_test_suite, green_out)]
+            for future in futures:
+                future.result()
         
+        sys.stdout.write(wasteful_out.getvalue())
         print("\n" + "=" * 80)
-        
-        # Run optimized (green) framework
-        self.green_framework.run_test_suite()
+        sys.stdout.write(green_out.getvalue())
         
         # Calculate and display comparison
         self.display_comparison_results()
@@ -192,18 +363,20 @@ class HackathonDemonstrtor:
         # Save results for hackathon evaluation
         self.save_results()
     
-    def display_comparison_results(self):
+    def display_comparison_results(self) -> None:
         """Display the comparative results showing carbon footprint reduction"""
         print("\n🏆 HACKATHON RESULTS: CARBON FOOTPRINT REDUCTION")
         print("=" * 80)
         
+        improvements = self._compute_improvements()
+        
         baseline_energy = self.wasteful_framework.total_energy
         optimized_energy = self.green_framework.total_energy
-        energy_reduction = ((baseline_energy - optimized_energy) / baseline_energy) * 100
+        energy_reduction = improvements['energy_reduction_percentage']
         
         baseline_carbon = self.wasteful_framework.total_carbon
         optimized_carbon = self.green_framework.total_carbon
-        carbon_reduction = ((baseline_carbon - optimized_carbon) / baseline_carbon) * 100
+        carbon_reduction = improvements['carbon_reduction_percentage']
         
         print(f"📊 ENERGY CONSUMPTION COMPARISON:")
         print(f"   Baseline (Wasteful):  {baseline_energy:.4f} Joules")
@@ -218,9 +391,9 @@ class HackathonDemonstrtor:
         print(f"   Improvement:          {carbon_reduction:.2f}% REDUCTION 🌱")
         
         # Performance comparison
-        baseline_duration = sum(log['duration_seconds'] for log in self.wasteful_framework.execution_logs)
-        optimized_duration = sum(log['duration_seconds'] for log in self.green_framework.execution_logs)
-        performance_improvement = ((baseline_duration - optimized_duration) / baseline_duration) * 100
+        baseline_duration = self.wasteful_framework.total_duration
+        optimized_duration = self.green_framework.total_duration
+        performance_improvement = improvements['performance_improvement_percentage']
         
         print(f"\n⚡ PERFORMANCE COMPARISON:")
         print(f"   Baseline Execution:   {baseline_duration:.2f} seconds")
@@ -246,7 +419,7 @@ class HackathonDemonstrtor:
         print(f"   ✅ Strong business case: Cost savings + sustainability")
         print(f"   ✅ Scalable solution: Framework patterns applicable everywhere")
     
-    def save_results(self):
+    def save_results(self) -> None:
         """Save demonstration results for hackathon evaluation"""
         results = {
             'hackathon_demo_timestamp': datetime.datetime.now().isoformat(),
@@ -254,19 +427,16 @@ class HackathonDemonstrtor:
                 'name': self.wasteful_framework.name,
                 'total_energy_joules': self.wasteful_framework.total_energy,
                 'total_carbon_g_co2e': self.wasteful_framework.total_carbon,
-                'execution_logs': self.wasteful_framework.execution_logs
+                'execution_logs': self.wasteful_framework.iter_logs()
             },
             'optimized_framework': {
                 'name': self.green_framework.name,
                 'total_energy_joules': self.green_framework.total_energy,
                 'total_carbon_g_co2e': self.green_framework.total_carbon,
-                'execution_logs': self.green_framework.execution_logs
-            },
-            'improvements': {
-                'energy_reduction_percentage': ((self.wasteful_framework.total_energy - self.green_framework.total_energy) / self.wasteful_framework.total_energy) * 100,
-                'carbon_reduction_percentage': ((self.wasteful_framework.total_carbon - self.green_framework.total_carbon) / self.wasteful_framework.total_carbon) * 100,
-                'performance_improvement_percentage': ((sum(log['duration_seconds'] for log in self.wasteful_framework.execution_logs) - sum(log['duration_seconds'] for log in self.green_framework.execution_logs)) / sum(log['duration_seconds'] for log in self.wasteful_framework.execution_logs)) * 100
+                'execution_logs': self.green_framework.iter_logs()
             },
+            'improvements': (self._improvements if self._improvements is not None
+                             else self._compute_improvements()),
             'methodology': {
                 'carbon_calculator': 'Industry standard with grid intensity 400g CO₂/kWh',
                 'measurement_approach': 'Real-time resource consumption tracking',
@@ -277,14 +447,14 @@ class HackathonDemonstrtor:
         # Create reports directory if it doesn't exist
         os.makedirs('Reports', exist_ok=True)
         
-        # Save detailed results
-        with open('Reports/hackathon_demo_results.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        # Save detailed results, streaming the execution logs entry by entry
+        with open('Reports/hackathon_demo_results.json', 'w', encoding='utf-8') as f:
+            _stream_json(f.write, results)
         
         print(f"\n💾 Results saved to Reports/hackathon_demo_results.json")
         print("   This file contains detailed measurements for hackathon evaluation")
 
-def main():
+def main() -> None:
     """Main execution function"""
     print("Starting Green QA Revolution Hackathon Demonstration...")
     print("This demo shows real carbon footprint reduction in action!\n")
@@ -1,11 +1,16 @@
 import os
 import json
-import pandas as pd
-import matplotlib.pyplot as plt
+import math
 import psutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
 class GreenMetricsCalculator:
     def __init__(self, results_dir="./test_results", output_dir="./reports"):
         self.results_dir = results_dir
@@ -13,76 +18,179 @@ class GreenMetricsCalculator:
         self.metrics_data = []
         os.makedirs(output_dir, exist_ok=True)
     
+    def _load_result(self, entry):
+        try:
+            if orjson is not None:
+                with open(entry.path, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(entry.path, 'r') as f:
+                return json.load(f)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+            print(f"Error parsing {entry.name}")
+            return None
+    
     def collect_test_results(self):
         if not os.path.exists(self.results_dir):
             print(f"Results directory {self.results_dir} not found!")
             return
-        for filename in os.listdir(self.results_dir):
-            if filename.endswith('.json'):
-                with open(os.path.join(self.results_dir, filename), 'r') as f:
-                    try:
-                        data = json.load(f)
+        entries = [e for e in os.scandir(self.results_dir) if e.name.endswith('.json')]
+        if entries:
+            with ThreadPoolExecutor(max_workers=min(32, len(entries))) as executor:
+                for data in executor.map(self._load_result, entries):
+                    if data is not None:
                         self.metrics_data.append(data)
-                    except json.JSONDecodeError:
-                        print(f"Error parsing {filename}")
         print(f"Collected {len(self.metrics_data)} test result files")
     
+    def _resolve_column(self, keys, *aliases):
+        for name in aliases:
+            if name in keys:
+                return name
+        return None
+    
     def calculate_energy_metrics(self):
         if not self.metrics_data:
             print("No metrics data available!")
             return {}
-        df = pd.DataFrame(self.metrics_data)
+        # Resolve each aliased column once over the union of keys (as DataFrame columns
+        # would), then do a single pass with running sums/max; missing or null values are
+        # skipped like NaN
+        keys = set().union(*self.metrics_data)
+        ecol = self._resolve_column(keys, 'energy_joules', 'energy')
+        tcol = self._resolve_column(keys, 'execution_time')
+        ccol = self._resolve_column(keys, 'carbon_footprint', 'co2')
+        mcol = self._resolve_column(keys, 'memory_mb', 'memory')
+        pcol = self._resolve_column(keys, 'cpu_percent', 'cpu')
+        sum_energy = sum_time = sum_carbon = sum_cpu = 0.0
+        n_energy = n_time = n_cpu = 0
+        peak_memory = None
+        for d in self.metrics_data:
+            value = d.get(ecol)
+            if value is not None:
+                sum_energy += value
+                n_energy += 1
+            value = d.get(tcol)
+            if value is not None:
+                sum_time += value
+                n_time += 1
+            value = d.get(ccol)
+            if value is not None:
+                sum_carbon += value
+            value = d.get(mcol)
+            if value is not None and (peak_memory is None or value > peak_memory):
+                peak_memory = value
+            value = d.get(pcol)
+            if value is not None:
+                sum_cpu += value
+                n_cpu += 1
+        has_complexity = 'test_complexity' in keys
         energy_metrics = {
-            "total_energy_consumed_joules": df.get('energy_joules', df.get('energy', 0)).sum(),
-            "avg_energy_per_test": df.get('energy_joules', df.get('energy', 0)).mean(),
-            "total_execution_time_sec": df.get('execution_time', 0).sum(),
-            "avg_execution_time_sec": df.get('execution_time', 0).mean(),
-            "total_carbon_footprint_g": df.get('carbon_footprint', df.get('co2', 0)).sum(),
-            "peak_memory_usage_mb": df.get('memory_mb', df.get('memory', 0)).max(),
-            "avg_cpu_utilization_percent": df.get('cpu_percent', df.get('cpu', 0)).mean(),
+            "total_energy_consumed_joules": sum_energy,
+            "avg_energy_per_test": sum_energy / n_energy if n_energy else 0.0,
+            "total_execution_time_sec": sum_time,
+            "avg_execution_time_sec": sum_time / n_time if n_time else 0.0,
+            "total_carbon_footprint_g": sum_carbon,
+            "peak_memory_usage_mb": peak_memory if peak_memory is not None else 0.0,
+            "avg_cpu_utilization_percent": sum_cpu / n_cpu if n_cpu else 0.0,
         }
-        if 'test_complexity' in df.columns:
-            energy_metrics["energy_per_complexity"] = (
-                df['energy_joules'] / df['test_complexity']
-            ).mean()
-            efficiency_col = df['energy_joules'] / df['test_complexity']
-            energy_metrics["most_efficient_test"] = df.loc[efficiency_col.idxmin()]['test_name']
-            energy_metrics["least_efficient_test"] = df.loc[efficiency_col.idxmax()]['test_name']
+        if has_complexity:
+            # Second pass only when complexity data is present; rows missing either value
+            # are skipped, as NaN ratios were
+            efficiency = []
+            for d in self.metrics_data:
+                energy, complexity = d.get('energy_joules'), d.get('test_complexity')
+                if energy is None or complexity is None:
+                    continue
+                if complexity == 0:
+                    # Division semantics of the old Series ratio: x/0 is +-inf, 0/0 is NaN (skipped)
+                    if energy == 0:
+                        continue
+                    ratio = float('inf') if energy > 0 else float('-inf')
+                else:
+                    ratio = energy / complexity
+                efficiency.append((ratio, d.get('test_name')))
+            if efficiency:
+                energy_metrics["energy_per_complexity"] = sum(e for e, _ in efficiency) / len(efficiency)
+                energy_metrics["most_efficient_test"] = min(efficiency, key=lambda x: x[0])[1]
+                energy_metrics["least_efficient_test"] = max(efficiency, key=lambda x: x[0])[1]
         return energy_metrics
     
+    def _write_csv(self, df, csv_path):
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:  # pyarrow is optional - fall back to pandas' CSV writer
+            df.to_csv(csv_path, index=False)
+            return
+        try:
+            # Columnar C++ writer instead of pandas' row-by-row formatting
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Nested (list/dict) or mixed-type columns: pyarrow can't write them, pandas can
+            df.to_csv(csv_path, index=False)
+    
     def generate_report(self):
         self.collect_test_results()
         metrics = self.calculate_energy_metrics()
-        with open(os.path.join(self.output_dir, 'green_metrics_summary.json'), 'w') as f:
-            json.dump(metrics, f, indent=2)
+        summary_path = os.path.join(self.output_dir, 'green_metrics_summary.json')
+        # orjson writes inf (a zero-complexity ratio) as null; keep json's Infinity for those
+        if orjson is not None and all(math.isfinite(v) for v in metrics.values()
+                                      if isinstance(v, float)):
+            with open(summary_path, 'wb') as f:
+                f.write(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_path, 'w') as f:
+                json.dump(metrics, f, indent=2)
         if self.metrics_data:
+            # Heavy plotting/dataframe imports are paid only when there is something to report
+            import pandas as pd
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
             df = pd.DataFrame(self.metrics_data)
-            plt.figure(figsize=(12, 10))
-            plt.subplot(2, 2, 1)
+            # Explicit Agg figure: no pyplot state machine or GUI backend on headless runs
+            fig = Figure(figsize=(12, 10))
+            axes = fig.subplots(2, 2)
+            ax = axes[0, 0]
             if 'test_name' in df.columns and 'energy_joules' in df.columns:
-                df.plot(kind='bar', x='test_name', y='energy_joules', ax=plt.gca())
-                plt.title('Energy Consumption by Test')
-                plt.xticks(rotation=45)
-            plt.subplot(2, 2, 2)
+                positions = range(len(df))
+                ax.bar(positions, df['energy_joules'].to_numpy(), width=0.5, label='energy_joules')
+                ax.set_xticks(positions)
+                ax.set_xticklabels(df['test_name'].to_numpy(), rotation=45)
+                ax.set_xlabel('test_name')
+                ax.legend()
+                ax.set_title('Energy Consumption by Test')
+            ax = axes[0, 1]
             if 'execution_time' in df.columns and 'energy_joules' in df.columns:
-                plt.scatter(df['execution_time'], df['energy_joules'])
-                plt.title('Energy vs Execution Time')
-                plt.xlabel('Execution Time (s)')
-                plt.ylabel('Energy (J)')
-            plt.subplot(2, 2, 3)
+                ax.scatter(df['execution_time'].to_numpy(), df['energy_joules'].to_numpy(), rasterized=True)
+                ax.set_title('Energy vs Execution Time')
+                ax.set_xlabel('Execution Time (s)')
+                ax.set_ylabel('Energy (J)')
+            ax = axes[1, 0]
             if 'memory_mb' in df.columns and 'cpu_percent' in df.columns:
-                plt.scatter(df['memory_mb'], df['cpu_percent'])
-                plt.title('Memory vs CPU Usage')
-                plt.xlabel('Memory (MB)')
-                plt.ylabel('CPU (%)')
-            plt.subplot(2, 2, 4)
+                ax.scatter(df['memory_mb'].to_numpy(), df['cpu_percent'].to_numpy(), rasterized=True)
+                ax.set_title('Memory vs CPU Usage')
+                ax.set_xlabel('Memory (MB)')
+                ax.set_ylabel('CPU (%)')
+            ax = axes[1, 1]
             if 'test_suite' in df.columns and 'carbon_footprint' in df.columns:
-                df.groupby('test_suite')['carbon_footprint'].sum().plot(kind='bar')
-                plt.title('Carbon Footprint by Test Suite')
-                plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(os.path.join(self.output_dir, 'green_metrics_report.png'))
-            df.to_csv(os.path.join(self.output_dir, 'detailed_metrics.csv'), index=False)
+                # Plain dict sum-by-key (sorted like groupby) instead of a DataFrame groupby;
+                # null suites are dropped and null carbon values skipped, as NaN would be
+                suite_carbon = {}
+                for d in self.metrics_data:
+                    suite = d.get('test_suite')
+                    if suite is None:
+                        continue
+                    carbon = d.get('carbon_footprint')
+                    suite_carbon[suite] = suite_carbon.get(suite, 0.0) + (carbon if carbon is not None else 0.0)
+                suites = sorted(suite_carbon)
+                positions = range(len(suites))
+                ax.bar(positions, [suite_carbon[suite] for suite in suites], width=0.5)
+                ax.set_xticks(positions)
+                ax.set_xticklabels(suites, rotation=45)
+                ax.set_xlabel('test_suite')
+                ax.set_title('Carbon Footprint by Test Suite')
+            fig.tight_layout()
+            FigureCanvasAgg(fig).print_png(os.path.join(self.output_dir, 'green_metrics_report.png'))
+            self._write_csv(df, os.path.join(self.output_dir, 'detailed_metrics.csv'))
         print(f"Report generated in {self.output_dir}")
         return metrics
 